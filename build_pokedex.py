@@ -1,15 +1,162 @@
+import asyncio
 import os
 import json
+import re
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+# Optional async file IO: with aiofiles available and POKEDEX_ASYNC_IO=1
+# set, reads are issued concurrently on the event loop so one file's
+# open/read latency overlaps with parsing the others. The process pool
+# remains the default path otherwise.
+try:
+    import aiofiles
+except ImportError:
+    aiofiles = None
+
+# Prefer orjson for JSON decode/encode: its C implementation is typically
+# 2-4x faster than the stdlib on the small-object-heavy Pokémon files.
+# Fall back to the stdlib so the script still runs without it installed.
+try:
+    import orjson
+
+    def _json_loads(data):
+        return orjson.loads(data)
+
+    def _json_dumps_line(obj):
+        # orjson always emits compact UTF-8 bytes
+        return orjson.dumps(obj)
+
+    def _json_dumps(obj):
+        # orjson always emits UTF-8 bytes and only supports 2-space indent
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _json_loads(data):
+        return json.loads(data)
+
+    def _json_dumps_line(obj):
+        return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+    def _json_dumps(obj):
+        return json.dumps(obj, ensure_ascii=False, indent=4).encode('utf-8')
+
+# Matches data filenames like '0001-妙蛙种子.json'; group 1 is the dex number
+_FILENAME_RE = re.compile(r'^(\d{4})-.*\.json$')
+
+# Matches a string-valued "name"/"name_en"/"name_jp" pair in raw JSON bytes
+_NAME_FIELD_RE = re.compile(rb'"(name|name_en|name_jp)"\s*:\s*"((?:\\.|[^"\\])*)"')
+
+def _extract_names(raw):
+    """
+    Pull name, name_en and name_jp out of raw JSON bytes with a single
+    C-level regex pass, skipping the full JSON decode (which would build a
+    large dict tree only to discard everything but three fields).
+
+    The top-level name fields come first in these files, so the first match
+    per key is the right one. Returns a {key: value} dict, or None when the
+    scan cannot be trusted (a field is missing, or its value contains escape
+    sequences) and the caller should fall back to a real JSON parse.
+    """
+    fields = {}
+    for m in _NAME_FIELD_RE.finditer(raw):
+        key = m.group(1)
+        if key not in fields:
+            fields[key] = m.group(2)
+            if len(fields) == 3:
+                break
+
+    if len(fields) != 3:
+        return None
+
+    names = {}
+    for key, value in fields.items():
+        if b'\\' in value:
+            # escaped content: let the JSON parser deal with it
+            return None
+        names[key.decode('ascii')] = value.decode('utf-8')
+    return names
+
+def _extract_row(file_path, raw):
+    """
+    Turn one file's raw JSON bytes into a (yudex_id, name, name_en, name_jp)
+    tuple, or None if the bytes could not be decoded.
+    """
+    filename = os.path.basename(file_path)
+    # The driver has already validated the filename format (e.g. '0001-妙蛙种子.json')
+    numeric_id = filename[:4]
+    yudex_id = f"Y{numeric_id}"
+
+    names = _extract_names(raw)
+    if names is None:
+        # Fallback: full decode, providing defaults if keys are missing
+        try:
+            data = _json_loads(raw)
+        except ValueError:
+            # covers both json.JSONDecodeError and orjson.JSONDecodeError;
+            # return the sentinel and let the driver report it rather than
+            # contending for stdout from worker processes
+            return None
+        if not isinstance(data, dict):
+            # valid JSON, but not an entry object — a raised AttributeError
+            # would abort the whole executor.map run, so sentinel this too
+            return None
+        names = {key: data.get(key, '') for key in ('name', 'name_en', 'name_jp')}
+
+    return (yudex_id, names['name'], names['name_en'], names['name_jp'])
+
+def _parse_one(file_path):
+    """
+    Parse a single Pokémon JSON file.
+
+    Returns a (yudex_id, name, name_en, name_jp) tuple, or None if the file
+    could not be read or decoded. Keeping the return value a small tuple
+    (instead of the full entry dict) keeps pickling traffic between worker
+    processes and the driver to a minimum.
+    """
+    # read_bytes slurps the file in one os.read without stacking
+    # BufferedReader/TextIOWrapper objects per file. scandir already proved
+    # the entry exists, but a file can still be unreadable (permissions,
+    # races); sentinel those instead of killing the whole run
+    try:
+        raw = Path(file_path).read_bytes()
+    except OSError:
+        return None
+    return _extract_row(file_path, raw)
+
+async def _parse_all_async(paths):
+    """
+    Parse all files on one core, overlapping each file's open/read latency
+    with the parsing of the others via the event loop. The semaphore caps
+    in-flight reads so file-descriptor usage stays bounded.
+    """
+    sem = asyncio.Semaphore(256)
+
+    async def one(file_path):
+        try:
+            async with sem:
+                async with aiofiles.open(file_path, 'rb') as f:
+                    raw = await f.read()
+        except OSError:
+            # same sentinel treatment as _parse_one: one unreadable file
+            # must not abort the whole gather
+            return None
+        return _extract_row(file_path, raw)
+
+    # gather preserves input order, same as executor.map
+    return await asyncio.gather(*(one(p) for p in paths))
 
 def build_yudu_pokedex():
     source_dir = r'g:\Pokemon_data\Pokemon_Yudu_MUD\data\pokemon'
     output_file = r'g:\Pokemon_data\Pokemon_Yudu_MUD\yudu_pokedex.json'
-    pokedex_data = []
 
     print(f"Starting to process files from: {source_dir}")
 
+    # os.scandir yields DirEntry objects with a ready-made .path, avoiding the
+    # per-filename os.path.join and the extra stat that listdir+open incurs
     try:
-        filenames = os.listdir(source_dir)
+        with os.scandir(source_dir) as it:
+            entries = [e for e in it if e.name.endswith('.json')]
     except FileNotFoundError:
         print(f"Error: Source directory not found: {source_dir}")
         return
@@ -17,51 +164,105 @@ def build_yudu_pokedex():
         print(f"Error listing directory {source_dir}: {e}")
         return
 
-    for filename in filenames:
-        if filename.endswith('.json'):
-            # Extract ID from filename (e.g., '0001-妙蛙种子.json' -> '0001')
-            if len(filename) >= 4 and filename[:4].isdigit():
-                numeric_id = filename[:4]
-                yudex_id = f"Y{numeric_id}"
-            else:
-                print(f"Warning: Skipping file with unexpected name format: {filename}")
-                continue
-
-            file_path = os.path.join(source_dir, filename)
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-
-                # Extract required fields, providing defaults if keys are missing
-                name = data.get('name', '')
-                name_en = data.get('name_en', '')
-                name_jp = data.get('name_jp', '')
-
-                pokemon_entry = {
-                    "yudex_id": yudex_id,
-                    "name": name,
-                    "name_en": name_en,
-                    "name_jp": name_jp,
-                    "world_gen": "Y"  # Set world_gen to 'Y' as requested
-                }
-                pokedex_data.append(pokemon_entry)
-
-            except FileNotFoundError:
-                print(f"Warning: File not found during processing: {file_path}")
-            except json.JSONDecodeError:
-                print(f"Warning: Error decoding JSON from file: {file_path}")
-            except Exception as e:
-                print(f"Warning: An unexpected error occurred processing file {file_path}: {e}")
-
-    # Sort the data by yudex_id before writing
-    pokedex_data.sort(key=lambda x: x['yudex_id'])
+    # Count skipped files instead of printing per event: stdout writes are
+    # synchronous and would dominate on warning-heavy runs, so one summary
+    # line is printed at the end (same pattern split_moves_by_type.py uses
+    # for its missing-field counts)
+    warn_counts = Counter()
+
+    paths = []
+    for entry in entries:
+        # Validate the '0001-妙蛙种子.json' naming scheme with one C-level
+        # regex match instead of a slice plus per-char isdigit
+        if _FILENAME_RE.match(entry.name):
+            paths.append(entry.path)
+        else:
+            warn_counts['bad_name'] += 1
+
+    # Sort the paths up front: the yudex_id is derived from the zero-padded
+    # filename prefix, and executor.map preserves input order, so the parsed
+    # rows come back already ordered by ID and no output sort is needed.
+    paths.sort()
+
+    # The asyncio path is explicit opt-in (POKEDEX_ASYNC_IO=1): it runs the
+    # parse serially on one core, so merely having aiofiles installed must
+    # not displace the multi-core process pool. Opt in when open() latency
+    # dominates and per-file parse time is short (the regex extractor), e.g.
+    # on Windows, where it also avoids process spawn cost.
+    if aiofiles is not None and os.environ.get('POKEDEX_ASYNC_IO') == '1':
+        results = asyncio.run(_parse_all_async(paths))
+    else:
+        # Parse files in parallel; each worker independently opens and
+        # decodes one file, so this scales roughly with the number of cores.
+        # chunksize amortizes the inter-process pickling cost over batches
+        # of paths.
+        with ProcessPoolExecutor() as executor:
+            results = list(executor.map(_parse_one, paths, chunksize=64))
 
+    # Workers return None for undecodable files; tally the sentinels here
+    rows = []
+    for row in results:
+        if row is None:
+            warn_counts['decode'] += 1
+        else:
+            rows.append(row)
+
+    if warn_counts:
+        print(f"Warning: Skipped {warn_counts['bad_name']} files with unexpected "
+              f"name format and {warn_counts['decode']} files that could not be "
+              f"read or decoded.")
+
+    # Rows stay as lean tuples until this point; the entry dicts are
+    # materialized only for serialization
+    pokedex_data = [
+        {
+            "yudex_id": yudex_id,
+            "name": name,
+            "name_en": name_en,
+            "name_jp": name_jp,
+            "world_gen": "Y"  # Set world_gen to 'Y' as requested
+        }
+        for yudex_id, name, name_en, name_jp in rows
+    ]
+
+    # The .json output keeps the array format: the game app
+    # (yudu-mud-app/src/lib/gameData.ts) JSON.parses the whole file and
+    # expects a list of entries.
     try:
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(pokedex_data, f, ensure_ascii=False, indent=4)
+        Path(output_file).write_bytes(_json_dumps(pokedex_data))
         print(f"Successfully created pokedex file: {output_file}")
     except Exception as e:
         print(f"Error writing output file {output_file}: {e}")
 
+    # Additionally emit newline-delimited JSON (one compact entry per line)
+    # as a sibling artifact: downstream tools can parse line ranges
+    # independently, and new entries can be tail-appended without rewriting
+    # the whole array. renumber_pokedex.py rewrites this sibling together
+    # with the .json so the two stay in sync; Python readers can go through
+    # load_pokedex below.
+    ndjson_file = os.path.splitext(output_file)[0] + '.ndjson'
+    try:
+        with open(ndjson_file, 'wb') as f:
+            for entry in pokedex_data:
+                f.write(_json_dumps_line(entry))
+                f.write(b'\n')
+        print(f"Successfully created pokedex file: {ndjson_file}")
+    except Exception as e:
+        print(f"Error writing output file {ndjson_file}: {e}")
+
+def load_pokedex(path):
+    """
+    Read a pokedex file produced by this script.
+
+    Accepts both the newline-delimited output written by build_yudu_pokedex
+    and the legacy single-array format, returning a list of entry dicts
+    either way.
+    """
+    raw = Path(path).read_bytes()
+    if raw.lstrip()[:1] == b'[':
+        # legacy pretty-printed JSON array
+        return _json_loads(raw)
+    return [_json_loads(line) for line in raw.splitlines() if line.strip()]
+
 if __name__ == "__main__":
-    build_yudu_pokedex()
\ No newline at end of file
+    build_yudu_pokedex()
@@ -1,37 +1,58 @@
-import json
+import itertools
+import mmap
+import os
+import re
 
 # 定义 JSON 文件路径
 file_path = 'g:\\Pokemon_data\\Pokemon_Yudu_MUD\\yudu_pokedex.json'
 
-# 读取 JSON 数据
-try:
-    with open(file_path, 'r', encoding='utf-8') as f:
-        pokedex_data = json.load(f)
-except FileNotFoundError:
-    print(f"错误：文件未找到 {file_path}")
-    exit()
-except json.JSONDecodeError:
-    print(f"错误：无法解析 JSON 文件 {file_path}")
-    exit()
+# 匹配 "yudex_id": "Yxxxx" 字段，捕获组保留键名、引号与空白的原有风格
+_YUDEX_ID_RE = re.compile(rb'("yudex_id"\s*:\s*")Y?\d+(")')
+
+def _renumber_file(path):
+    """
+    直接在原始字节上重编号：按文件中出现的顺序依次替换每个 yudex_id，
+    完全跳过 JSON 反序列化/再序列化，既省去重建整个 dict 树的成本，
+    也保证文件中其余内容一个字节都不会被改动。对 JSON 数组和 NDJSON
+    两种格式同样适用。
+    """
+    counter = itertools.count(1)
+
+    try:
+        with open(path, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                # re 可直接在 mmap 缓冲上匹配，无需先复制成 bytes
+                new_data = _YUDEX_ID_RE.sub(
+                    lambda m: b'%sY%04d%s' % (m.group(1), next(counter), m.group(2)),
+                    mm,
+                )
+    except FileNotFoundError:
+        print(f"错误：文件未找到 {path}")
+        return False
+    except ValueError:
+        # 空文件无法 mmap（"cannot mmap an empty file"），按无法解析处理
+        print(f"错误：无法解析 JSON 文件 {path}")
+        return False
+
+    renumbered = next(counter) - 1
+    if renumbered == 0:
+        print(f"警告：未在文件中找到任何 'yudex_id' 字段：{path}")
+
+    # 将更新后的数据写回文件
+    try:
+        with open(path, 'wb') as f:
+            f.write(new_data)
+        print(f"成功重新编号 {renumbered} 个条目并更新文件：{path}")
+    except IOError as e:
+        print(f"错误：写入文件时出错 {path}: {e}")
+        return False
+    return True
 
-# 检查数据是否为列表
-if not isinstance(pokedex_data, list):
-    print(f"错误：JSON 文件的顶层结构不是列表 {file_path}")
+if not _renumber_file(file_path):
     exit()
 
-# 重新编号 yudex_id
-new_index = 1
-for pokemon in pokedex_data:
-    if isinstance(pokemon, dict) and 'yudex_id' in pokemon:
-        pokemon['yudex_id'] = f"Y{new_index:04d}"
-        new_index += 1
-    else:
-        print(f"警告：跳过无效的条目或缺少 'yudex_id' 的条目: {pokemon}")
-
-# 将更新后的数据写回文件
-try:
-    with open(file_path, 'w', encoding='utf-8') as f:
-        json.dump(pokedex_data, f, ensure_ascii=False, indent=4)
-    print(f"成功重新编号并更新文件：{file_path}")
-except IOError as e:
-    print(f"错误：写入文件时出错 {file_path}: {e}")
\ No newline at end of file
+# build_pokedex.py 还会生成同名 .ndjson 副本；如存在则一并重编号，
+# 避免两个文件的编号悄悄不一致
+ndjson_path = os.path.splitext(file_path)[0] + '.ndjson'
+if os.path.exists(ndjson_path):
+    _renumber_file(ndjson_path)
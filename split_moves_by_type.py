@@ -1,12 +1,49 @@
 import json
+import mmap
 import os
-from collections import defaultdict
+import string
 import sys # Needed for __file__ when run directly
+from itertools import groupby
+from operator import itemgetter
+
+# Translation table for sanitizing output filenames: ASCII characters other
+# than letters, digits, '-' and '_' become '_', while non-ASCII (e.g. the
+# Chinese type names) falls through unchanged — one C-level translate() call
+# instead of a per-character generator with two predicate checks.
+_SAFE_CHARS = frozenset(string.ascii_letters + string.digits + '-_')
+_FILENAME_SAFE_TABLE = {
+    o: o if chr(o) in _SAFE_CHARS else ord('_') for o in range(128)
+}
+
+# Prefer orjson for JSON decoding (2-4x faster than the stdlib on the large
+# move_list.json); fall back to the stdlib so the script runs without it.
+try:
+    import orjson
+
+    def _json_loads(data):
+        return orjson.loads(data)
+except ImportError:
+    def _json_loads(data):
+        # stdlib json does not accept buffer objects such as mmap
+        if not isinstance(data, (str, bytes, bytearray)):
+            data = bytes(data)
+        return json.loads(data)
+
+# Optional streaming (SAX-style) parser: with ijson available, moves are
+# yielded one at a time so peak memory stays at one-move size instead of the
+# whole decoded list. The C-backed yajl2_c backend is ~5x faster than the
+# pure-python one, so prefer it when present.
+try:
+    from ijson.common import JSONError as _IjsonError
+    try:
+        import ijson.backends.yajl2_c as ijson
+    except ImportError:
+        import ijson
+except ImportError:
+    ijson = None
+    _IjsonError = None
 
 # --- Configuration ---
-import os
-import sys # Needed for __file__ when run directly
-
 try:
     # Get the absolute path of the directory containing the script
     script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -25,6 +62,46 @@ INPUT_JSON_PATH = os.path.join(PROJECT_ROOT, 'data', 'move_list.json')
 OUTPUT_DIR = os.path.join(PROJECT_ROOT, 'data', 'move_lists_by_type')
 # --- End Configuration ---
 
+def _iter_moves(path):
+    """
+    Yield move dicts from the input JSON one at a time.
+
+    With ijson installed this streams the file, keeping only the current move
+    in memory. Otherwise it falls back to decoding the whole (memory-mapped)
+    file at once and iterating the resulting list.
+    """
+    if ijson is not None:
+        with open(path, 'rb') as f:
+            # ijson.items silently yields nothing for a non-list root, where
+            # the fallback below raises — check the first non-whitespace
+            # byte (a JSON list root must start with '[') so both paths
+            # reject such input the same way
+            head = f.read(1)
+            while head.isspace():
+                head = f.read(1)
+            if head != b'[':
+                raise ValueError("expected the root of move_list.json to be a list of move objects")
+            f.seek(0)
+
+            try:
+                yield from ijson.items(f, 'item')
+            except _IjsonError as e:
+                # ijson's JSONError subclasses Exception, not ValueError;
+                # re-raise so malformed input hits the caller's handler the
+                # same way decode errors from the fallback path do
+                raise ValueError(str(e)) from e
+        return
+
+    with open(path, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # orjson wants bytes/memoryview, not the raw mmap object
+            all_moves = _json_loads(memoryview(mm))
+
+    if not isinstance(all_moves, list):
+        raise ValueError("expected the root of move_list.json to be a list of move objects")
+
+    yield from all_moves
+
 def split_moves():
     """
     Reads move_list.json, extracts move names by type, and writes them
@@ -42,79 +119,80 @@ def split_moves():
         print(f"Error creating directory {OUTPUT_DIR}: {e}")
         return
 
-    # 2. Read and parse the input JSON file
+    # 2. Collect (type, name) pairs from the stream. Only the two small
+    # strings per move stay in memory, never the full move dicts.
+    pairs = []
+    missing_type_count = 0
+    missing_name_count = 0
+
+    # One itemgetter call replaces two .get() method lookups per move; the
+    # odd malformed move pays for the exception, not the millions that don't
+    get_type_name = itemgetter('type', 'name')
+
     try:
-        with open(INPUT_JSON_PATH, 'r', encoding='utf-8') as f:
-            all_moves = json.load(f)
-        print(f"Successfully read and parsed {INPUT_JSON_PATH}")
+        for move in _iter_moves(INPUT_JSON_PATH):
+            try:
+                move_type, move_name = get_type_name(move)
+            except TypeError:
+                print(f"Warning: Skipping non-dictionary item in move list: {move}")
+                continue
+            except KeyError:
+                if 'type' not in move:
+                    missing_type_count += 1
+                else:
+                    missing_name_count += 1
+                continue
+
+            if not move_type:
+                # print(f"Warning: Move missing 'type' field: {move}")
+                missing_type_count += 1
+                continue # Skip moves without a type
+
+            if not move_name:
+                # print(f"Warning: Move missing 'name' field: {move}")
+                missing_name_count += 1
+                # Decide if you want to skip or use an ID/placeholder
+                continue # Skip moves without a name for now
+
+            pairs.append((move_type, move_name))
     except FileNotFoundError:
         print(f"Error: Input file not found at {INPUT_JSON_PATH}")
         print("Please ensure move_list.json is in the 'data' directory and the script is run from the 'Pokemon_Yudu_MUD' directory.")
         return
-    except json.JSONDecodeError as e:
-        print(f"Error decoding JSON from {INPUT_JSON_PATH}: {e}")
-        return
-    except Exception as e:
-        print(f"An unexpected error occurred while reading the file: {e}")
-        return
-
-    # 3. Categorize moves by type
-    moves_by_type = defaultdict(list)
-    missing_type_count = 0
-    missing_name_count = 0
-
-    if not isinstance(all_moves, list):
-        print("Error: Expected the root of move_list.json to be a list of move objects.")
+    except ValueError as e:
+        # covers both json.JSONDecodeError and orjson.JSONDecodeError
+        print(f"Error reading {INPUT_JSON_PATH}: {e}")
         return
 
-    for move in all_moves:
-        if not isinstance(move, dict):
-            print(f"Warning: Skipping non-dictionary item in move list: {move}")
-            continue
-
-        move_type = move.get('type')
-        move_name = move.get('name')
-
-        if not move_type:
-            # print(f"Warning: Move missing 'type' field: {move}")
-            missing_type_count += 1
-            continue # Skip moves without a type
-
-        if not move_name:
-            # print(f"Warning: Move missing 'name' field: {move}")
-            missing_name_count += 1
-            # Decide if you want to skip or use an ID/placeholder
-            continue # Skip moves without a name for now
-
-        moves_by_type[move_type].append(move_name)
-
     if missing_type_count > 0:
          print(f"Warning: Skipped {missing_type_count} moves due to missing 'type' field.")
     if missing_name_count > 0:
          print(f"Warning: Skipped {missing_name_count} moves due to missing 'name' field.")
 
+    # 3. Bucket by sorting once instead of per-move dict appends: one stable
+    # sort keeps names in input order within each type, and groupby then
+    # yields each type as a contiguous run.
+    pairs.sort(key=itemgetter(0))
 
-    print(f"Categorized moves into {len(moves_by_type)} types.")
+    print(f"Categorized moves into {len(set(map(itemgetter(0), pairs)))} types.")
 
-    # 4. Write categorized move names to separate files
+    # 4. Write each type's names with a single joined write per file
     written_files_count = 0
-    for move_type, move_names in moves_by_type.items():
+    for move_type, group in groupby(pairs, key=itemgetter(0)):
         # Sanitize filename (replace potentially problematic characters if any)
-        safe_filename = "".join(c if c.isalnum() or c in ('-', '_') else '_' for c in move_type) + ".txt"
+        safe_filename = move_type.translate(_FILENAME_SAFE_TABLE) + ".txt"
         output_filepath = os.path.join(OUTPUT_DIR, safe_filename)
 
         try:
-            with open(output_filepath, 'w', encoding='utf-8') as f:
-                for name in move_names:
-                    f.write(f"{name}\n")
-            # print(f"Written {len(move_names)} moves to {output_filepath}")
+            with open(output_filepath, 'wb') as f:
+                f.write('\n'.join(name for _, name in group).encode('utf-8'))
+                f.write(b'\n')
             written_files_count += 1
         except IOError as e:
             print(f"Error writing to file {output_filepath}: {e}")
         except Exception as e:
              print(f"An unexpected error occurred while writing file {safe_filename}: {e}")
 
-
     print(f"\nProcess finished. Successfully wrote招式列表 for {written_files_count} types to '{OUTPUT_DIR}'.")
 
 if __name__ == "__main__":